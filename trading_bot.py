@@ -5,192 +5,364 @@ Production-grade trading bot with API error handling and Telegram alerts
 
 import os
 import json
+import functools
 import time
 import logging
-from datetime import datetime, timedelta
+import logging.handlers
+import queue
+import atexit
+import asyncio
+import threading
 import requests
-import pandas as pd
-import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import hashlib
 import hmac
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:  # stdlib fallback; both accept str or bytes
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+try:
+    import websockets
+except ImportError:  # Streaming is optional; the bot falls back to REST polling
+    websockets = None
+
+# Callers only enqueue records; a QueueListener thread does the file/console I/O
+# Handlers write directly until start_log_listener() moves them behind a queue,
+# so processes that only import this module still get their records
+_log_handlers = [
+    logging.FileHandler('trading_bot.log', delay=True),
+    logging.StreamHandler()
+]
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('trading_bot.log'),
-        logging.StreamHandler()
-    ]
+    handlers=_log_handlers
 )
 logger = logging.getLogger(__name__)
 
+_log_listener = None
+
+
+def start_log_listener():
+    """Move the log handlers onto a background thread (idempotent; stopped at exit)"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    root = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    _log_listener = logging.handlers.QueueListener(log_queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    for handler in _log_handlers:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
 
 class CredentialManager:
     """Safely loads credentials from environment variables or config file"""
     
+    # credential name -> environment variable / config file key
+    CREDENTIAL_KEYS = {
+        'api_key': 'BINANCE_API_KEY',
+        'api_secret': 'BINANCE_API_SECRET',
+        'telegram_token': 'TELEGRAM_BOT_TOKEN',
+        'telegram_chat_id': 'TELEGRAM_CHAT_ID'
+    }
+    CONFIG_FILE = 'binance_config.json'
+    
     @staticmethod
-    def load_credentials():
-        """Load Binance API credentials securely"""
+    @functools.lru_cache(maxsize=1)
+    def _resolve_credentials() -> Dict[str, Optional[str]]:
+        """Read env vars once, falling back to the config file for gaps"""
         
-        api_key = os.getenv('BINANCE_API_KEY')
-        api_secret = os.getenv('BINANCE_API_SECRET')
-        telegram_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        telegram_chat_id = os.getenv('TELEGRAM_CHAT_ID')
+        creds = {
+            name: os.getenv(env_key)
+            for name, env_key in CredentialManager.CREDENTIAL_KEYS.items()
+        }
         
-        if not api_key:
+        if not all(creds.values()):
             try:
-                with open('binance_config.json', 'r') as f:
-                    config = json.load(f)
-                    api_key = config.get('BINANCE_API_KEY')
-                    api_secret = config.get('BINANCE_API_SECRET')
-                    telegram_token = config.get('TELEGRAM_BOT_TOKEN')
-                    telegram_chat_id = config.get('TELEGRAM_CHAT_ID')
+                with open(CredentialManager.CONFIG_FILE, 'rb') as f:
+                    config = json_loads(f.read())
+                for name, env_key in CredentialManager.CREDENTIAL_KEYS.items():
+                    if not creds[name]:
+                        creds[name] = config.get(env_key)
             except FileNotFoundError:
                 pass
         
-        if not all([api_key, api_secret, telegram_token, telegram_chat_id]):
-            raise ValueError("Missing credentials!")
+        return creds
+    
+    @staticmethod
+    def validate() -> Tuple[bool, List[str]]:
+        """Check credential presence without raising; returns (ok, missing keys)"""
         
-        return {
-            'api_key': api_key,
-            'api_secret': api_secret,
-            'telegram_token': telegram_token,
-            'telegram_chat_id': telegram_chat_id
-        }
+        creds = CredentialManager._resolve_credentials()
+        missing = [
+            env_key for name, env_key in CredentialManager.CREDENTIAL_KEYS.items()
+            if not creds[name]
+        ]
+        return not missing, missing
+    
+    @staticmethod
+    def load_credentials() -> Dict[str, str]:
+        """Load Binance API credentials securely (resolved once per process)"""
+        
+        ok, missing = CredentialManager.validate()
+        
+        if not ok:
+            raise ValueError(f"Missing credentials! {', '.join(missing)}")
+        
+        return dict(CredentialManager._resolve_credentials())
 
 
 class BinanceClient:
     """Binance API client with error handling"""
     
+    __slots__ = (
+        'api_key', 'api_secret', 'base_url', 'stream_url', 'request_timeout', 'max_retries',
+        'rate_limit_per_sec', 'rate_limit_burst', '_tokens', '_last_refill', '_rate_lock',
+        '_secret_bytes', '_hmac_proto', 'session', '_headers', '_urls', '_user_stream_url',
+        'cache_max_entries', '_cache'
+    )
+    
+    # Kline interval unit suffix -> seconds
+    INTERVAL_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800, 'M': 2592000}
+    
     def __init__(self, api_key: str, api_secret: str):
         self.api_key = api_key
         self.api_secret = api_secret
         self.base_url = "https://api.binance.com"
+        self.stream_url = "wss://stream.binance.com:9443"
         self.request_timeout = 10
         self.max_retries = 3
-        self.last_request_time = 0
-        self.min_request_interval = 0.1
+        # Token bucket: sustained 10 req/s, bursts of up to 10 requests
+        self.rate_limit_per_sec = 10.0
+        self.rate_limit_burst = 10.0
+        self._tokens = self.rate_limit_burst
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        # Encoded and keyed once; copying the keyed prototype per request skips the
+        # HMAC key setup that even the one-shot hmac.digest() repeats on every call
+        self._secret_bytes = api_secret.encode('ascii')
+        self._hmac_proto = hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
         
-    def _get_signature(self, params_str: str) -> str:
-        """Generate Binance signature"""
-        return hmac.new(
-            self.api_secret.encode(),
-            params_str.encode(),
-            hashlib.sha256
-        ).hexdigest()
-    
-    def _get_headers(self) -> Dict:
-        """Get Binance request headers"""
-        return {
+        # Pooled keep-alive connections instead of a new TLS handshake per call.
+        # urllib3 retries 429/5xx with jittered exponential backoff and honours Retry-After.
+        # POST is left to the default idempotent set: a 5xx on an order leaves its execution
+        # status unknown, and a replay may duplicate it or fall outside recvWindow.
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+        
+        # Constant per client, so built once rather than per request
+        self._headers = {
             'X-MBX-APIKEY': self.api_key,
             'Content-Type': 'application/x-www-form-urlencoded'
         }
+        self._urls: Dict[str, str] = {}
+        self._user_stream_url = self.base_url + "/api/v3/userDataStream"
+        
+        # Short-lived results keyed by endpoint+params: key -> (monotonic expiry, value)
+        self.cache_max_entries = 256
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+    
+    def _get_signature(self, params_str: str) -> str:
+        """Generate Binance signature"""
+        h = self._hmac_proto.copy()
+        h.update(params_str.encode('ascii'))
+        return h.hexdigest()
     
     def _rate_limit_check(self):
-        """Enforce rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting (thread-safe)"""
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit_burst,
+                self._tokens + (now - self._last_refill) * self.rate_limit_per_sec
+            )
+            self._last_refill = now
+            
+            if self._tokens < 1.0:
+                time.sleep((1.0 - self._tokens) / self.rate_limit_per_sec)
+                self._last_refill = time.monotonic()
+                self._tokens = 1.0
+            
+            self._tokens -= 1.0
     
-    def _request(self, method: str, endpoint: str, params: Dict = None) -> Dict:
-        """Make authenticated API request"""
-        
-        if params is None:
-            params = {}
-        
-        params['timestamp'] = int(time.time() * 1000)
-        params_str = "&".join([f"{k}={v}" for k, v in params.items()])
-        signature = self._get_signature(params_str)
-        params['signature'] = signature
-        
-        url = f"{self.base_url}{endpoint}"
-        headers = self._get_headers()
-        
-        for attempt in range(self.max_retries):
-            try:
-                self._rate_limit_check()
-                
-                if method == "GET":
-                    response = requests.get(url, params=params, headers=headers, timeout=self.request_timeout)
-                elif method == "POST":
-                    response = requests.post(url, params=params, headers=headers, timeout=self.request_timeout)
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-                
-                logger.info(f"DEBUG - Status: {response.status_code}")
-                logger.info(f"DEBUG - Response: {response.text[:200]}")
-                
-                if response.status_code == 429:
-                    wait_time = int(response.headers.get('Retry-After', 60))
-                    logger.warning(f"Rate limited! Waiting {wait_time}s")
-                    time.sleep(wait_time)
-                    continue
-                
-                if response.status_code != 200:
-                    logger.error(f"API Error {response.status_code}: {response.text}")
-                    if attempt < self.max_retries - 1:
-                        time.sleep(2 ** attempt)
-                        continue
-                    return {}
-                
-                return response.json()
+    def _url(self, endpoint: str) -> str:
+        """Full URL for an endpoint, memoized"""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self.base_url + endpoint
+        return url
+    
+    def _signed_query(self, params: Optional[Dict]) -> str:
+        """Build the timestamped, signed query string (caller's dict is left untouched)"""
+        items = list(params.items()) if params else []
+        items.append(('timestamp', time.time_ns() // 1_000_000))
+        params_str = urlencode(sorted(items))
+        # Send the exact string that was signed so the server sees the same order
+        return f"{params_str}&signature={self._get_signature(params_str)}"
+    
+    def _send(self, send, url: str, params=None, headers: Optional[Dict] = None) -> Any:
+        """Rate-limit, issue one HTTP call and decode its JSON body (None on failure)"""
+        try:
+            self._rate_limit_check()
+            response = send(url, params=params, headers=headers, timeout=self.request_timeout)
             
-            except requests.exceptions.Timeout:
-                logger.warning(f"Request timeout (attempt {attempt + 1}/{self.max_retries})")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    continue
+            # Raw bytes, read once; decoded only for log output
+            body = response.content
             
-            except Exception as e:
-                logger.error(f"Request failed: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2)
-                    continue
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Status=%s body=%s", response.status_code, body[:200].decode('utf-8', 'replace'))
+            
+            if response.status_code != 200:
+                logger.error(f"API Error {response.status_code}: {body.decode('utf-8', 'replace')}")
+                return None
+            
+            return json_loads(body)
         
-        logger.error(f"Failed to complete request after {self.max_retries} retries")
-        return {}
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+            # urllib3 has already retried these with backoff
+            logger.warning(f"Request failed after {self.max_retries} retries: {e}")
+        
+        except Exception as e:
+            logger.error(f"Request failed: {e}")
+        
+        return None
+    
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """Stable cache key for an endpoint and its (unsigned) params"""
+        return f"{endpoint}:{sorted(params.items()) if params else ''}"
+    
+    def _cache_get(self, key: str) -> Any:
+        """Cached value for key, or None if missing/expired (expired entries are dropped)"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() < entry[0]:
+            return entry[1]
+        self._cache.pop(key, None)
+        return None
+    
+    def _cache_put(self, key: str, value: Any, ttl: float):
+        """Store value for ttl seconds, purging expired entries when the cache grows"""
+        now = time.monotonic()
+        if len(self._cache) >= self.cache_max_entries:
+            for stale in [k for k, (expires, _) in list(self._cache.items()) if expires <= now]:
+                self._cache.pop(stale, None)
+        self._cache[key] = (now + ttl, value)
+    
+    def _public_get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Unsigned GET for market-data endpoints"""
+        query = urlencode(sorted(params.items())) if params else None
+        return self._send(self.session.get, self._url(endpoint), query)
+    
+    def _signed_get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Signed GET for account endpoints"""
+        return self._send(self.session.get, self._url(endpoint), self._signed_query(params), self._headers)
+    
+    def _signed_post(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Signed POST for trading endpoints"""
+        return self._send(self.session.post, self._url(endpoint), self._signed_query(params), self._headers)
     
-    def get_account_balance(self) -> float:
-        """Get USDT balance"""
+    def get_account_balance(self, ttl: float = 30.0) -> float:
+        """Get USDT balance (cached for ttl seconds)"""
+        key = self._cache_key("/api/v3/account")
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self._request("GET", "/api/v3/account")
+            response = self._signed_get("/api/v3/account")
             
-            logger.info(f"DEBUG - Raw Response: {str(response)[:200]}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw Response: %s", str(response)[:200])
             
             if not response or 'balances' not in response:
                 logger.error(f"Invalid balance response: {response}")
                 return 0.0
             
-            for balance in response.get('balances', []):
-                if balance.get('asset') == 'USDT':
-                    free_balance = float(balance.get('free', 0))
-                    
-                    if free_balance < 0 or free_balance > 1_000_000:
-                        logger.warning(f"Suspicious balance: ${free_balance}")
-                        return 0.0
-                    
-                    return free_balance
-            
-            logger.warning("No USDT balance found")
-            return 0.0
+            usdt = next((b for b in response['balances'] if b.get('asset') == 'USDT'), None)
+            
+            if usdt is None:
+                logger.warning("No USDT balance found")
+                return 0.0
+            
+            free_balance = float(usdt.get('free', 0))
+            
+            if free_balance < 0 or free_balance > 1_000_000:
+                logger.warning(f"Suspicious balance: ${free_balance}")
+                return 0.0
+            
+            self._cache_put(key, free_balance, ttl)
+            return free_balance
         
         except Exception as e:
             logger.error(f"Error getting balance: {e}")
             return 0.0
     
-    def get_ticker(self, symbol: str) -> Optional[Dict]:
-        """Get current ticker price"""
+    def get_tickers(self, symbols: List[str], ttl: float = 1.0) -> Dict[str, float]:
+        """Get {symbol: price} for the given pairs in a single public request (cached for ttl seconds)"""
+        # Compact JSON list, sorted so the same pairs always share one cache entry
+        params = {'symbols': '["' + '","'.join(sorted(symbols)) + '"]'}
+        key = self._cache_key("/api/v3/ticker/price", params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self._request("GET", "/api/v3/ticker/price", {"symbol": symbol})
+            response = self._public_get("/api/v3/ticker/price", params)
+            
+            if not response:
+                return {}
             
-            if not response or 'price' not in response:
+            tickers = {t['symbol']: float(t['price']) for t in response}
+            self._cache_put(key, tickers, ttl)
+            return tickers
+        
+        except Exception as e:
+            logger.error(f"Error getting tickers: {e}")
+            return {}
+    
+    def get_ticker(self, symbol: str, ttl: float = 1.0,
+                   symbols: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get current ticker price
+        
+        Pass the full list of pairs as symbols so that looking each of them up
+        shares one cached request.
+        """
+        try:
+            price = self.get_tickers(symbols or [symbol], ttl).get(symbol)
+            
+            if price is None:
                 logger.error(f"Invalid ticker response for {symbol}")
                 return None
             
-            price = float(response.get('price', 0))
-            
             if price <= 0 or price > 1_000_000:
                 logger.error(f"Invalid price for {symbol}: ${price}")
                 return None
@@ -200,13 +372,92 @@ class BinanceClient:
         except Exception as e:
             logger.error(f"Error getting ticker for {symbol}: {e}")
             return None
+    
+    def get_klines(self, symbol: str, interval: str = "1h", limit: int = 100,
+                   ttl: Optional[float] = None):
+        """Get validated candles as a float64 array (rows in Binance kline column order)
+        
+        Cached for ttl seconds, by default half the candle interval. The array is
+        shared with the cache, so it is returned read-only.
+        """
+        import numpy as np
+        
+        if ttl is None:
+            unit_seconds = self.INTERVAL_SECONDS.get(interval[-1:])
+            if unit_seconds is None or not interval[:-1].isdigit():
+                logger.error(f"Invalid kline interval: {interval}")
+                return None
+            ttl = int(interval[:-1]) * unit_seconds / 2
+        
+        params = {'symbol': symbol, 'interval': interval, 'limit': limit}
+        key = self._cache_key("/api/v3/klines", params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        try:
+            klines = self._public_get("/api/v3/klines", params)
+            
+            if not klines:
+                logger.error(f"Invalid klines response for {symbol}")
+                return None
+            
+            try:
+                arr = np.asarray(klines, dtype=np.float64)
+            except ValueError:
+                # Ragged/malformed payload: keep only rows that parse
+                rows = []
+                for kline in klines:
+                    try:
+                        rows.append([float(v) for v in kline[:8]])
+                    except (TypeError, ValueError):
+                        continue
+                arr = np.asarray([row for row in rows if len(row) == 8], dtype=np.float64)
+            
+            if arr.ndim != 2 or arr.shape[1] < 8:
+                logger.error(f"Invalid klines response for {symbol}")
+                return None
+            
+            # close > 0 and quote volume >= 0, checked in one vectorized pass
+            candles = arr[(arr[:, 4] > 0) & (arr[:, 7] >= 0)]
+            candles.setflags(write=False)
+            
+            self._cache_put(key, candles, ttl)
+            return candles
+        
+        except Exception as e:
+            logger.error(f"Error getting klines for {symbol}: {e}")
+            return None
+    
+    def create_listen_key(self) -> Optional[str]:
+        """Open a user data stream (API-key only, no signature)"""
+        response = self._send(self.session.post, self._user_stream_url, headers=self._headers)
+        return response.get('listenKey') if response else None
+    
+    def keepalive_listen_key(self, listen_key: str) -> bool:
+        """Extend a user data stream's 60-minute validity"""
+        # Binance answers a successful keepalive with an empty object
+        response = self._send(self.session.put, self._user_stream_url, {'listenKey': listen_key}, self._headers)
+        return response is not None
 
 
 class SurvivalTradingBot:
     """Survivor-mode trading bot for Binance"""
     
+    __slots__ = (
+        'client', 'telegram_token', 'telegram_chat_id', 'telegram_session', '_telegram_url',
+        '_alert_q', '_alert_thread',
+        'risk_per_trade', 'take_profit_pct', 'stop_loss_pct', 'max_daily_loss',
+        'max_open_positions', 'trading_pairs',
+        'daily_loss', 'open_positions', 'last_reset_day', 'consecutive_errors',
+        'stream_stale_after', 'listen_key_keepalive', '_latest_balance', '_account_streaming',
+        '_last_account_update', '_latest_tickers', '_last_stream_message', 'health_interval'
+    )
+    
     def __init__(self):
         """Initialize bot"""
+        start_log_listener()
+        
         try:
             creds = CredentialManager.load_credentials()
             
@@ -217,6 +468,16 @@ class SurvivalTradingBot:
             
             self.telegram_token = creds['telegram_token']
             self.telegram_chat_id = creds['telegram_chat_id']
+            self.telegram_session = requests.Session()
+            self.telegram_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+            self.telegram_session.headers['Content-Type'] = 'application/json'
+            self._telegram_url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+            
+            # Alerts are queued and posted by a background thread so Telegram latency never stalls the loop
+            self._alert_q = queue.Queue(maxsize=256)
+            self._alert_thread = threading.Thread(target=self._alert_worker, name="telegram-alerts", daemon=True)
+            self._alert_thread.start()
+            atexit.register(self.close)
             
             self.risk_per_trade = 3
             self.take_profit_pct = 8
@@ -227,9 +488,19 @@ class SurvivalTradingBot:
             
             self.daily_loss = 0
             self.open_positions = {}
-            self.last_reset = datetime.now().date()
+            self.last_reset_day = int(time.time() // 86400)  # UTC day number
             self.consecutive_errors = 0
             
+            # Pushed by the WebSocket stream; REST is only used when it goes quiet
+            self.stream_stale_after = 30
+            self.listen_key_keepalive = 30 * 60
+            self._latest_balance = None
+            self._account_streaming = False
+            self._last_account_update = 0.0
+            self._latest_tickers = {}
+            self._last_stream_message = 0.0
+            self.health_interval = 60
+            
             logger.info("✅ Bot initialized successfully")
             self.send_alert("🤖 Trading Bot Started on Binance")
         
@@ -237,21 +508,144 @@ class SurvivalTradingBot:
             logger.error(f"❌ Failed to initialize bot: {e}")
             raise
     
+    def close(self):
+        """Flush pending alerts and release pooled HTTP connections"""
+        try:
+            self._alert_q.put(None, timeout=1)
+            self._alert_thread.join(timeout=5)
+        except queue.Full:
+            pass
+        self.client.close()
+        self.telegram_session.close()
+    
+    def _alert_worker(self):
+        """Post queued alerts to Telegram until the None sentinel arrives"""
+        while True:
+            message = self._alert_q.get()
+            if message is None:
+                break
+            
+            try:
+                self.telegram_session.post(self._telegram_url, data=json_dumps({
+                    'chat_id': self.telegram_chat_id,
+                    'text': message
+                }), timeout=5)
+            except Exception as e:
+                logger.error(f"Failed to send alert: {e}")
+    
     def send_alert(self, message: str):
-        """Send Telegram alert"""
+        """Queue a Telegram alert (non-blocking)"""
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            requests.post(url, json={
-                'chat_id': self.telegram_chat_id,
-                'text': message
-            }, timeout=5)
-        except Exception as e:
-            logger.error(f"Failed to send alert: {e}")
+            self._alert_q.put_nowait(message)
+        except queue.Full:
+            logger.error(f"Alert queue full, dropping alert: {message}")
+    
+    def _stream_is_fresh(self) -> bool:
+        """True if the WebSocket stream delivered a message recently"""
+        return time.monotonic() - self._last_stream_message < self.stream_stale_after
+    
+    def _account_is_fresh(self) -> bool:
+        """True if the user-data channel is subscribed and confirmed alive recently
+        
+        Account events only arrive when balances change, so a successful listen-key
+        keepalive also counts as a sign of life.
+        """
+        return (
+            self._account_streaming
+            and self._stream_is_fresh()
+            and time.monotonic() - self._last_account_update
+            < self.listen_key_keepalive + self.stream_stale_after
+        )
+    
+    def _start_stream(self):
+        """Start the WebSocket listener in a background thread"""
+        if websockets is None:
+            logger.warning("websockets not installed - using REST polling only")
+            return
+        
+        threading.Thread(target=self._stream_worker, name="binance-stream", daemon=True).start()
+    
+    def _stream_worker(self):
+        """Keep the stream connected, reconnecting after failures"""
+        while True:
+            try:
+                asyncio.run(self._ws_listen())
+            except Exception as e:
+                logger.error(f"Stream disconnected: {e}")
+            # Balance changes may be missed while disconnected; reseed from REST
+            self._account_streaming = False
+            self._latest_balance = None
+            time.sleep(5)
+    
+    async def _ws_listen(self):
+        """Subscribe to tickers for all trading pairs, plus account updates when possible"""
+        streams = [f"{pair.lower()}@miniTicker" for pair in self.trading_pairs]
+        
+        # Public tickers still stream if the key lacks user-data permission
+        listen_key = self.client.create_listen_key()
+        if listen_key:
+            streams.insert(0, listen_key)
+        else:
+            logger.warning("No listen key - streaming public tickers only")
+        
+        url = f"{self.client.stream_url}/stream?streams={'/'.join(streams)}"
+        keepalive_at = time.monotonic() + self.listen_key_keepalive
+        
+        async with websockets.connect(url) as ws:
+            logger.info("📡 Stream connected")
+            self._account_streaming = bool(listen_key)
+            self._last_account_update = time.monotonic()
+            async for raw in ws:
+                self._handle_stream_message(json_loads(raw))
+                
+                if not listen_key:
+                    continue
+                
+                if not self._account_streaming:
+                    raise RuntimeError("Listen key expired")
+                
+                if time.monotonic() >= keepalive_at:
+                    if not await asyncio.to_thread(self.client.keepalive_listen_key, listen_key):
+                        self._account_streaming = False
+                        raise RuntimeError("Listen key keepalive failed")
+                    self._last_account_update = time.monotonic()
+                    keepalive_at = time.monotonic() + self.listen_key_keepalive
+    
+    def _handle_stream_message(self, message: Dict):
+        """Update cached balance/tickers from a combined-stream message"""
+        data = message.get('data', {})
+        event = data.get('e')
+        
+        if event == 'outboundAccountPosition':
+            for balance in data.get('B', []):
+                if balance.get('a') == 'USDT':
+                    free = float(balance.get('f', 0))
+                    if free < 0 or free > 1_000_000:
+                        # Drop the cached value so check_health falls back to REST
+                        logger.warning(f"Suspicious balance: ${free}")
+                        free = None
+                    self._latest_balance = free
+            self._last_account_update = time.monotonic()
+        
+        elif event == 'listenKeyExpired':
+            logger.warning("Listen key expired - reconnecting")
+            self._account_streaming = False
+        
+        elif event == '24hrMiniTicker':
+            self._latest_tickers[data['s']] = {'price': float(data['c']), 'time': time.monotonic()}
+        
+        self._last_stream_message = time.monotonic()
     
     def check_health(self):
         """Check bot health"""
         try:
-            balance = self.client.get_account_balance()
+            # Read once: the stream thread may reset it to None at any moment
+            balance = self._latest_balance
+            if balance is None or not self._account_is_fresh():
+                balance = self.client.get_account_balance()
+                # Seed the cache; the stream only pushes balances when they change
+                if balance > 0:
+                    self._latest_balance = balance
             
             if balance == 0.0:
                 self.consecutive_errors += 1
@@ -266,12 +660,42 @@ class SurvivalTradingBot:
             logger.error(f"Health check failed: {e}")
             return 0.0
     
+    def _streamed_prices(self) -> Dict[str, float]:
+        """Prices pushed by the stream within stream_stale_after, for the pairs that have one"""
+        cutoff = time.monotonic() - self.stream_stale_after
+        prices = {}
+        for pair in self.trading_pairs:
+            ticker = self._latest_tickers.get(pair)
+            if ticker is not None and ticker['time'] > cutoff:
+                prices[pair] = ticker['price']
+        return prices
+    
+    def poll_prices(self) -> Dict[str, float]:
+        """Current price for every trading pair in at most one round-trip"""
+        prices = self._streamed_prices()
+        if len(prices) == len(self.trading_pairs):
+            return prices
+        
+        # Every lookup shares one cached request for all trading pairs
+        prices = {}
+        for pair in self.trading_pairs:
+            ticker = self.client.get_ticker(pair, symbols=self.trading_pairs)
+            if ticker:
+                prices[pair] = ticker['price']
+        return prices
+    
     def run(self):
         """Main bot loop"""
         logger.info("Starting bot loop...")
+        self._start_stream()
         
         while True:
             try:
+                today = int(time.time() // 86400)
+                if today != self.last_reset_day:
+                    self.daily_loss = 0
+                    self.last_reset_day = today
+                
                 balance = self.check_health()
                 
                 if balance > 0:
@@ -279,7 +703,11 @@ class SurvivalTradingBot:
                 else:
                     logger.warning("⚠️ Cannot fetch balance")
                 
-                time.sleep(60)
+                prices = self.poll_prices()
+                if prices:
+                    logger.info("📈 " + ", ".join(f"{pair}: ${price:,.2f}" for pair, price in prices.items()))
+                
+                time.sleep(self.health_interval)
             
             except KeyboardInterrupt:
                 logger.info("Bot stopped")